@@ -11,7 +11,7 @@ from .manager import DeviceManager
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
   """Creates a DeviceManager to discover devices and poll their attributes."""
-  manager = DeviceManager(hass)
+  manager = DeviceManager(hass, entry)
 
   # Make the DeviceManager available to async_setup_entry for each domain
   hass.data.setdefault(DOMAIN, {})[MANAGER_DATA_KEY] = manager
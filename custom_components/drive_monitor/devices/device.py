@@ -1,14 +1,20 @@
 """Abstract base class for monitored devices."""
 
+import sys
+
 from abc import abstractmethod, ABC
 from dataclasses import dataclass
 from datetime import date, datetime
 from enum import Enum
-from typing import Iterable
+from functools import cache, lru_cache
+from typing import Any, Iterable
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo, Entity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
+
+from ..const import DOMAIN
 
 SensorValue = str | int | float | date | datetime | Enum
 
@@ -21,7 +27,7 @@ class DeviceNotFoundError(Error):
   """When querying a specific device, it could not be found."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StoreID:
   """Key used to uniquely identify datastores attached to a computer.
 
@@ -41,43 +47,65 @@ class Device(ABC):
     node: Base of a device node, with any suffixes stripped; e.g. 'disk1'.
     name: Human-readable name of the device, e.g. 'Macintosh HD'.
     entities: HA entities exposed by this device.
+    coordinator: Coordinator that polls this device, shared by its entities.
+    device_info: Unique identifier that HA uses to group Entities under this
+        Device. It's created once, and its fields are updated in place by
+        'apply', so entities can share it.
   """
 
-  def __init__(self, store: StoreID):
+  def __init__(self, store: StoreID, coordinator: DataUpdateCoordinator):
     self.id: str = store.id
     self.node: str = store.node
     self.name: str | None = None
+    self.coordinator: DataUpdateCoordinator = coordinator
+    self.device_info: DeviceInfo = DeviceInfo(identifiers={(DOMAIN, self.id)})
 
     # List of entities belonging to this devices. Entities automatically add
     # themselves to this list as they are created.
     self.entities: list[Entity] = []
 
-  @property
   @abstractmethod
-  def device_info(self) -> DeviceInfo:
-    """Unique identifier that HA uses to group Entities under this Device."""
+  def apply(self, info: Any):
+    """Sets the device's attributes and entity values from its queried info.
 
-  @abstractmethod
-  async def update(self):
-    """Polls the state of the device's entities, and updates their values.
-
-    This method should be annotated with @async_cache with a TTL. That's because
-    Entities are normally all polled together, and this method will therefore be
-    called many times. Even if the underlying data is cached, it's still better
-    not to repeat setting all the attributes and sensor values unnecessarily.
+    This is called by the DeviceManager each time the coordinator polls all
+    devices, before the device's entities are notified. It does no I/O; it only
+    copies values from an already-queried info object, e.g. a DriveInfo.
     """
 
 
+@lru_cache(maxsize=256)
 def entity_id(device_id: str, entity_name: str) -> str:
   """Returns an entity's ID, guaranteed to be unique within its domain."""
-  return f'{device_id}_{entity_name}'
+  return sys.intern(f'{device_id}_{entity_name}')
+
+
+def enum_label(value: Enum) -> SensorValue:
+  """Returns the value that HA shows for an Enum member.
+
+  Enums whose values aren't meant for display, e.g. DriveState, define a 'label'
+  property for the member's display string. Otherwise its value is shown as-is.
+  """
+  return getattr(value, 'label', value.value)
+
+
+@cache
+def enum_options(values: type[Enum]) -> list[SensorValue]:
+  """Returns the labels of an Enum, as sensor options.
+
+  Sensors with the same Enum share the result, which must not be modified.
+  """
+  return [enum_label(value) for value in values]
 
 
-class DeviceEntity(Entity):
-  """Base class for monitored device Entities."""
+class DeviceEntity(CoordinatorEntity):
+  """Base class for monitored device Entities.
+
+  Entities aren't polled individually; the device's coordinator polls all of
+  them together, and notifies them once their values have been updated.
+  """
 
   _attr_has_entity_name = True
-  _attr_should_poll = True
 
   def __init__(self, device: Device, name: str | None = None):
     """
@@ -85,27 +113,17 @@ class DeviceEntity(Entity):
       device: Device that this entity is a part of.
       name: Human-readable name of the entity.
     """
+    super().__init__(device.coordinator)
+
     self.device = device
 
+    # Shared with the device, which fills in fields such as its name later.
+    self._attr_device_info = device.device_info
     self._attr_unique_id = entity_id(device.id, name) if name else device.id
     self._attr_name = name
 
     device.entities.append(self)
 
-  @property
-  def device_info(self) -> DeviceInfo:
-    """Unique identifier that HA uses to group Entities under this Device.
-
-    This is a property, rather than an attribute, because it must be computed
-    lazily. Fields such as the device name aren't set yet when the Entity is
-    created; they are populated later, by 'update'.
-    """
-    return self.device.device_info
-
-  async def async_update(self):
-    """Callback fired when HA polls the entity's current value or state."""
-    await self.device.update()  # Cached w/ TTL, so fine for each entity to call
-
 
 class DeviceSensor(SensorEntity, DeviceEntity):
   """Sensor entity for one of the device's attributes."""
@@ -151,14 +169,33 @@ class DeviceSensor(SensorEntity, DeviceEntity):
     self._attr_suggested_unit_of_measurement = suggested_unit_of_measurement
     self._attr_suggested_display_precision = suggested_display_precision
 
-    if values:
-      self._attr_options = [value.value if isinstance(value, Enum) else value for value in values]
+    if isinstance(values, type) and issubclass(values, Enum):
+      self._attr_options = enum_options(values)
+    elif values:
+      self._attr_options = [
+          enum_label(value) if isinstance(value, Enum) else value for value in values]
 
+    self._value: SensorValue | None = None
+    self._native_value: SensorValue | None = None
     self.value = value
 
+  @property
+  def value(self) -> SensorValue | None:
+    """The current sensor measurement, as last assigned."""
+    return self._value
+
+  @value.setter
+  def value(self, value: SensorValue | None):
+    # Most attributes are unchanged from one poll to the next.
+    if value == self._value:
+      return
+
+    # HA reads native_value far more often than we assign it, so unwrap enums
+    # once here rather than on every read.
+    self._value = value
+    self._native_value = enum_label(value) if isinstance(value, Enum) else value
+
   @property
   def native_value(self) -> SensorValue | None:
     """The current sensor measurement in its native units."""
-    if isinstance(self.value, Enum):
-      return self.value.value
-    return self.value
+    return self._native_value
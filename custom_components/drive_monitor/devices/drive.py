@@ -1,28 +1,19 @@
 """Device representing a physical drive and all of its HA Entities."""
 
-import asyncio
-import logging
-import typing
-
 from dataclasses import dataclass
-from enum import unique, StrEnum
+from enum import unique, IntEnum, StrEnum
 from functools import cached_property
+from typing import Final
 
 from homeassistant.components.sensor import SensorDeviceClass
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from ..const import DOMAIN
-from ..devices.device import DeviceNotFoundError
 from ..manufacturers import Manufacturer
-from ..sources.source import get as get_source
-from ..utils import async_cache
 
 from .device import Device, DeviceSensor, StoreID
 
-LOGGER = logging.getLogger(__name__)
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DriveID(StoreID):
   """Key used to uniquely identify drives attached to a computer.
 
@@ -33,11 +24,27 @@ class DriveID(StoreID):
 
 
 @unique
-class DriveState(StrEnum):
-  """Physical drive type/interface."""
-  UNKNOWN = 'Unknown'  # Unknown/unrecognized state.
-  HEALTHY = 'Healthy'  # Drive is passing S.M.A.R.T. checks.
-  UNHEALTHY = 'Unhealthy'  # Drive is failing S.M.A.R.T. checks.
+class DriveState(IntEnum):
+  """Health of a physical drive.
+
+  States are compared often, and only displayed in the HA UI, so the values are
+  ints, and their display strings are held separately in DRIVE_STATE_LABELS.
+  """
+  UNKNOWN = 0  # Unknown/unrecognized state.
+  HEALTHY = 1  # Drive is passing S.M.A.R.T. checks.
+  UNHEALTHY = 2  # Drive is failing S.M.A.R.T. checks.
+
+  @property
+  def label(self) -> str:
+    """Human-readable name of the state, as shown in the HA UI."""
+    return DRIVE_STATE_LABELS[self]
+
+
+DRIVE_STATE_LABELS: Final[dict[DriveState, str]] = {
+  DriveState.UNKNOWN: 'Unknown',
+  DriveState.HEALTHY: 'Healthy',
+  DriveState.UNHEALTHY: 'Unhealthy',
+}
 
 
 @unique
@@ -48,7 +55,7 @@ class DriveType(StrEnum):
   NVME = 'NVMe'  # NVMe SSD
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SSDInfo:
   """Additional attributes specific to solid-state disks."""
   bytes_read: int | None = None
@@ -58,7 +65,7 @@ class SSDInfo:
   unsafe_shutdowns: int | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DriveInfo:
   """Physical drive info and S.M.A.R.T attributes."""
   name: str = 'Unknown'
@@ -81,8 +88,8 @@ class Drive(Device):
     raid: ID of the RAID that this drive belongs to, if any.
   """
 
-  def __init__(self, store: DriveID):
-    super().__init__(store)
+  def __init__(self, store: DriveID, coordinator: DataUpdateCoordinator):
+    super().__init__(store, coordinator)
 
     self.raid: str | None = store.raid
 
@@ -113,17 +120,6 @@ class Drive(Device):
         device_class=SensorDeviceClass.TEMPERATURE,
         unit_of_measurement='°C')
 
-  @property
-  def device_info(self) -> DeviceInfo:
-    """Unique identifier that HA uses to group Entities under this Device."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, self.id)},
-        name=self.name,
-        manufacturer=self.manufacturer,
-        model=self.model,
-        sw_version=self.firmware_version,
-    )
-
   @cached_property
   def available_spare(self) -> DeviceSensor:
     """Percentage of an SSD's 'spare capacity' that remains unused."""
@@ -163,20 +159,16 @@ class Drive(Device):
     """Number of times the drive has shut down uncleanly."""
     return DeviceSensor(self, 'Unsafe Shutdowns')
 
-  @async_cache(ttl=10)  # Allow child Entities to call this without re-executing
-  async def update(self):
-    """Updates all of the device's attributes and entities."""
-    source = await get_source()
-    try:
-      info = await source.get_drive_info(self.node)
-    except DeviceNotFoundError:  # Most likely a removable drive
-      LOGGER.info('Drive %s could no longer be found; it may have been removed.', self.name)
-      return
-
-    self.name = info.name
-    self.manufacturer = info.manufacturer
-    self.model = info.model
-    self.firmware_version = info.firmware_version
+  def apply(self, info: DriveInfo):
+    """Sets all of the device's attributes and entities from the given info."""
+    attributes = (info.name, info.manufacturer, info.model, info.firmware_version)
+    if attributes != (self.name, self.manufacturer, self.model, self.firmware_version):
+      self.name, self.manufacturer, self.model, self.firmware_version = attributes
+      self.device_info.update(
+          name=self.name,
+          manufacturer=self.manufacturer,
+          model=self.model,
+          sw_version=self.firmware_version)
 
     self.state.value = DriveState.HEALTHY if info.smart_passed else DriveState.UNHEALTHY
     if not self.raid:
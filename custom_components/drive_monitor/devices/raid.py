@@ -1,25 +1,18 @@
 """Device representing a RAID, its drives, and all of its HA Entities."""
 
-import asyncio
-
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import unique, StrEnum
-from functools import cached_property
 
 from homeassistant.components.sensor import SensorDeviceClass
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from ..const import DOMAIN
-from ..devices.device import DeviceNotFoundError
 from ..manufacturers import Manufacturer
-from ..sources.source import get as get_source
-from ..utils import async_cache
 
 from .device import Device, DeviceSensor, StoreID
 from .drive import Drive
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RAIDID(StoreID):
   """Key used to uniquely identify RAIDs attached to a computer."""
 
@@ -42,7 +35,7 @@ class RAIDState(StrEnum):
   REBUILD = 'Rebuild'  # Online but rebuilding the mirror after a fault.
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RAIDDriveInfo:
   """Attributes and state for a single drive within a RAID."""
   id: str
@@ -50,13 +43,13 @@ class RAIDDriveInfo:
   state: RAIDState = RAIDState.UNKNOWN
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RAIDInfo:
   """RAID attributes and drive state."""
   name: str = 'Unknown'
   type: RAIDType = RAIDType.UNKNOWN
   state: RAIDState = RAIDState.UNKNOWN
-  members: list[RAIDDriveInfo] = field(default_factory=list)
+  members: tuple[RAIDDriveInfo, ...] = ()
   capacity: int | None = None
   usage: int | None = None
 
@@ -64,8 +57,8 @@ class RAIDInfo:
 class RAID(Device):
   """Device representing a RAID, its drives, and all of its HA Entities."""
 
-  def __init__(self, store: RAIDID):
-    super().__init__(store)
+  def __init__(self, store: RAIDID, coordinator: DataUpdateCoordinator):
+    super().__init__(store, coordinator)
 
     self.drives: list[Drive] = []
 
@@ -87,28 +80,15 @@ class RAID(Device):
         suggested_unit_of_measurement='TB',
         suggested_display_precision=2)
 
-  @property
-  def device_info(self) -> DeviceInfo:
-    """Unique identifier that HA uses to group Entities under this Device."""
-    return DeviceInfo(
-        identifiers={(DOMAIN, self.id)},
-        name=self.name,
-        manufacturer=self.manufacturer.value,
-        model=self.model,
-    )
-
-  @async_cache(ttl=10)  # Allow child Entities to call this without re-executing
-  async def update(self):
-    """Initializes the device's attributes and entities."""
-    source = await get_source()
-    try:
-      info = await source.get_raid_info(self.node)
-    except DeviceNotFoundError:
-      return
-
-    self.name = info.name
-    self.manufacturer = Manufacturer.APPLE
-    self.model = str(info.type)
+  def apply(self, info: RAIDInfo):
+    """Sets all of the device's attributes and entities from the given info."""
+    attributes = (info.name, Manufacturer.APPLE, str(info.type))
+    if attributes != (self.name, self.manufacturer, self.model):
+      self.name, self.manufacturer, self.model = attributes
+      self.device_info.update(
+          name=self.name,
+          manufacturer=self.manufacturer.value,
+          model=self.model)
 
     self.state.value = info.state
     self.capacity.value = info.capacity
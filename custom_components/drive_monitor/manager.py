@@ -7,14 +7,17 @@ import itertools
 import logging
 import os
 
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .const import DOMAIN, SCAN_INTERVAL
 from .devices.device import Device
 from .devices.drive import Drive
 from .devices.raid import RAID
-from .sources.source import get as get_source
+from .sources.source import get as get_source, Snapshot, Source
 
 LOGGER = logging.getLogger(__name__)
 
@@ -27,17 +30,37 @@ class DeviceManager:
   hold a list of Entities for each device, which are added to Home Assistant by
   their corresponding entity platform module.
 
+  Devices are polled together by a single HA DataUpdateCoordinator. Each update
+  queries a Snapshot of all devices from the Source, and applies it to the
+  Devices before their Entities are notified.
+
   Attributes:
     drives: List of physical drives being managed.
         Includes drives that are members of a RAID.
     raids: List of RAIDs being managed.
+    coordinator: Coordinator that polls all devices, shared by their Entities.
   """
 
-  def __init__(self, hass: HomeAssistant):
+  def __init__(self, hass: HomeAssistant, entry: ConfigEntry):
     self.drives: dict[str, Drive] = {}
     self.raids: dict[str, RAID] = {}
 
+    self.coordinator: DataUpdateCoordinator[Snapshot] = DataUpdateCoordinator(
+        hass, LOGGER,
+        config_entry=entry,
+        name=DOMAIN,
+        update_interval=SCAN_INTERVAL,
+        update_method=self._update,
+        # Snapshots compare by value, so entities are only written when the
+        # state of some device has actually changed.
+        always_update=False)
+
+    # Entities of all devices, indexed by each class in their MRO, so that each
+    # entity platform can look up the entities it's responsible for.
+    self._entities_by_class: dict[type, list[Entity]] = {}
+
     self._hass: HomeAssistant = hass
+    self._source: Source | None = None
 
   async def add_entities(self, async_add_devices: AddEntitiesCallback, entity_class: type[Entity]):
     """Adds all entities of the given type, from all monitored devices, to HA.
@@ -46,10 +69,8 @@ class DeviceManager:
       async_add_devices: HA add entity callback passed from async_setup_entry.
       entity_class: Entity subclass to filter on.
     """
-    entities = []
-    for device in itertools.chain(self.drives.values(), self.raids.values()):
-      entities.extend(entity for entity in device.entities if isinstance(entity, entity_class))
-    async_add_devices(entities, update_before_add=True)
+    # The coordinator has already refreshed, so there's no need to update first.
+    async_add_devices(self._entities_by_class.get(entity_class, []))
 
   async def initialize(self):
     """Initializes the set of drives and RAIDs being managed.
@@ -57,20 +78,45 @@ class DeviceManager:
     Prior to calling this method, the 'drives' and 'raids' attributes are empty
     dicts. After this method returns, they are populated with Drives and RAIDs.
     """
-    source = await get_source()
-    drives, raids = await asyncio.gather(source.get_drives(), source.get_raids())
+    self._source = await get_source()
+    async with asyncio.TaskGroup() as group:
+      drives = group.create_task(self._source.get_drives())
+      raids = group.create_task(self._source.get_raids())
 
-    for drive in drives:
-      self.drives[drive.node] = Drive(drive)
+    for drive in drives.result():
+      self.drives[drive.node] = Drive(drive, self.coordinator)
 
-    for raid in raids:
-      self.raids[raid.node] = RAID(raid)
+    for raid in raids.result():
+      self.raids[raid.node] = RAID(raid, self.coordinator)
 
-    # Perform an initial update of all devices.
-    # This is necessary even though we set update_before_add=True above. That's
-    # because some sensors are created as part of the initial update. E.g. SSD
-    # health sensors are only created once we know that the drive is an SSD.
-    devices = itertools.chain(self.drives.values(), self.raids.values())
-    await asyncio.gather(*[device.update() for device in devices])
+    # Perform an initial update of all devices before adding their entities.
+    # That's because some sensors are created as part of the initial update.
+    # E.g. SSD health sensors are only created once we know that the drive is an
+    # SSD.
+    await self.coordinator.async_config_entry_first_refresh()
 
-    LOGGER.info(f'Discovered {len(drives)} drives and {len(raids)} RAIDs.')
+    for device in itertools.chain(self.drives.values(), self.raids.values()):
+      for entity in device.entities:
+        for cls in type(entity).__mro__:
+          self._entities_by_class.setdefault(cls, []).append(entity)
+
+    LOGGER.info(f'Discovered {len(self.drives)} drives and {len(self.raids)} RAIDs.')
+
+  async def _update(self) -> Snapshot:
+    """Queries a Snapshot of all devices, and applies it to each Device."""
+    try:
+      snapshot = await self._source.snapshot()
+    except* (OSError, ValueError) as e:  # Failed to run a tool, or parse its output
+      raise UpdateFailed(f'Failed to query devices: {e.exceptions[0]}') from e
+
+    for node, drive in self.drives.items():
+      if info := snapshot.drives.get(node):
+        drive.apply(info)
+      else:  # Most likely a removable drive
+        LOGGER.info('Drive %s could no longer be found; it may have been removed.', drive.name)
+
+    for node, raid in self.raids.items():
+      if info := snapshot.raids.get(node):
+        raid.apply(info)
+
+    return snapshot
@@ -2,26 +2,31 @@
 
 The `manufacturers` directory contains .txt files for each Manufacturer enum
 value, except for UNKNOWN. Each line in these files is a regular expression that
-matches the model name or family for one of that manufacturer's devices.
+matches the model name or family for one of that manufacturer's devices. Blank
+lines and lines starting with '#' are ignored.
+
+Patterns are matched case-insensitively, from the start of the model name. All
+lines are combined into a single regex, so a line can't use global inline flags
+such as '(?i)', or capturing groups, including named groups and backreferences;
+use non-capturing '(?:...)' groups instead. Lines that do are logged and ignored.
 """
 
 from __future__ import annotations
 
-import asyncio
+import logging
 import os
 import re
 
-from collections import defaultdict
 from enum import unique, Enum
-from functools import cached_property
+from functools import lru_cache
+from pathlib import Path
 from re import Pattern
 
+LOGGER = logging.getLogger(__name__)
+
 # Path to the directory containing manufacturer .txt files.
 DB_PATH = os.path.dirname(__file__)
 
-# Global mapping from manufacturer name to list of model family regexes.
-_manufacturers: dict[Manufacturer, list[Pattern]] = defaultdict(list)
-
 
 @unique
 class Manufacturer(Enum):
@@ -32,31 +37,74 @@ class Manufacturer(Enum):
   TEAMGROUP = 'TeamGroup'
 
 
-def _load_manufacturers():
-  """Reads files from disk to initialize the manufacturer mapping."""
-  for manufacturer in Manufacturer:
-    if manufacturer != Manufacturer.UNKNOWN:
-      with open(os.path.join(DB_PATH, f'{manufacturer.name.lower()}.txt'), 'rt') as f:
-        _manufacturers[manufacturer].extend(
-            re.compile(line, flags=re.IGNORECASE) for line in f.read().splitlines())
+def _is_valid(line: str, filename: str) -> bool:
+  """Returns whether a database line can be combined with the other lines.
+
+  Logs an error for each line that can't.
+  """
+  try:
+    # Compile the line on its own, to catch unbalanced parentheses that the
+    # wrapping group could otherwise hide, and as it's embedded in the combined
+    # regex, to catch global inline flags, which must be at the regex's start.
+    re.compile(line)
+    if re.compile(f'(?:{line})').groups:
+      raise re.error('capturing groups are not supported; use (?:...) instead')
+  except re.error as e:
+    LOGGER.error('Ignoring invalid pattern "%s" in %s: %s', line, filename, e)
+    return False
+  return True
+
+
+def _load_manufacturers() -> Pattern | None:
+  """Reads files from disk to build the manufacturer pattern.
+
+  All regexes are combined into a single alternation, with each manufacturer's
+  lines wrapped in a group named after it, so that a model can be matched
+  against the entire database with one scan. Groups are in Manufacturer enum
+  order, which decides the winner if several match.
+
+  Returns None if the database is empty.
+  """
+  patterns = {}
+  with os.scandir(DB_PATH) as entries:
+    for entry in entries:
+      stem, extension = os.path.splitext(entry.name)
+      if extension != '.txt' or stem.upper() not in Manufacturer.__members__:
+        continue
+      lines = [line for line in Path(entry.path).read_text().splitlines()
+               if line and not line.startswith('#') and _is_valid(line, entry.name)]
+      if lines:
+        patterns[Manufacturer[stem.upper()]] = '|'.join(f'(?:{line})' for line in lines)
+
+  if not patterns:
+    return None
+
+  return re.compile('|'.join(f'(?P<{manufacturer.name}>{patterns[manufacturer]})'
+                             for manufacturer in Manufacturer if manufacturer in patterns),
+                    flags=re.IGNORECASE)
+
 
+# Combined regex of all manufacturers' model families. This is loaded at import,
+# which HA performs outside of the event loop.
+_pattern: Pattern | None = _load_manufacturers()
 
-async def get(model: str) -> Manufacturer:
+
+@lru_cache(maxsize=512)
+def get(model: str) -> Manufacturer:
   """Returns the manufacturer of a given model of device.
 
-  This method matches the given model against each regex in the manufacturer
+  This method matches the given model against the regexes in the manufacturer
   database. It returns the corresponding manufacturer enum value for the first
   match. If no regex matches, it returns Manufacturer.UNKNOWN.
 
+  Results are cached, since the same few models are looked up on every poll.
+
   Args:
     The model name or family of a device, e.g. "Apple SD/SM/TS...E/F/G SSDs".
   """
-  if not _manufacturers:
-    loop = asyncio.get_running_loop()
-    await loop.run_in_executor(None, _load_manufacturers)
-
-  for manufacturer, regexes in _manufacturers.items():
-    if any(regex.match(model) for regex in regexes):
-      return manufacturer
+  if _pattern and (match := _pattern.match(model)):
+    # Database lines have no groups of their own, so the only group that can
+    # match is the one named after the manufacturer.
+    return Manufacturer[match.lastgroup]
 
   return Manufacturer.UNKNOWN
@@ -7,7 +7,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, MANAGER_DATA_KEY, SCAN_INTERVAL
+from .const import DOMAIN, MANAGER_DATA_KEY
 
 
 async def async_setup_entry(
@@ -7,9 +7,10 @@ of individual drives we use `smartctl`.
 
 import asyncio
 
+from dataclasses import replace
 from functools import cached_property
+from typing import Iterable
 
-from ..devices.device import DeviceNotFoundError
 from ..devices.drive import DriveID, DriveInfo
 from ..devices.raid import RAIDID, RAIDInfo
 
@@ -43,26 +44,53 @@ class MacOSSource(Source):
     """Enumerates and returns all RAIDs present on the system."""
     return await self._diskutil.get_raids()
 
-  async def get_drive_info(self, node: str) -> DriveInfo:
-    """Returns details and S.M.A.R.T. attributes for the given drive.
+  async def get_drive_infos(self, nodes: Iterable[str]) -> dict[str, DriveInfo]:
+    """Returns details and S.M.A.R.T. attributes for each of the given drives.
+
+    Drives that can no longer be found are omitted from the result.
 
     Args:
-      node: The drive's Device Node, e.g. 'disk3'.
+      nodes: The drives' Device Nodes, e.g. ['disk3', 'disk4'].
     """
-    diskutil_info, smartctl_info = await asyncio.gather(
-        self._diskutil.get_drive_info(node), self._smartctl.get_drive_info(node))
-
-    if not (diskutil_info or smartctl_info):
-      raise DeviceNotFoundError(f'There is no drive with node "{node}".')
-
-    # We can get most drive info from smartctl, but name, capacity, and usage
-    # are only reliably available via diskutil's APFS container stats.
-    if diskutil_info and smartctl_info:
-      smartctl_info.name = diskutil_info.name
-      smartctl_info.capacity = diskutil_info.capacity
-      smartctl_info.usage = diskutil_info.usage
-
-    return smartctl_info or diskutil_info
+    nodes = list(nodes)
+
+    # Let both tools run to completion even if one fails, so that the other's
+    # subprocess isn't cancelled midway, and its cached result can be reused.
+    diskutil_infos, smartctl_infos = await asyncio.gather(
+        self._diskutil.get_all_drive_info(), self._smartctl.get_all_drive_info(nodes),
+        return_exceptions=True)
+
+    # Don't fall back to partial info if either tool failed; e.g. default
+    # S.M.A.R.T. state would read as unhealthy. Raising lets the coordinator
+    # report the failure and keep each device's last state.
+    for result in (smartctl_infos, diskutil_infos):
+      if isinstance(result, BaseException):
+        raise result
+
+    infos = {}
+    for node in nodes:
+      # Omit drives that smartctl failed to query, rather than falling back to
+      # diskutil's info; its default S.M.A.R.T. state would read as unhealthy.
+      # The coordinator keeps their last known state instead.
+      if node not in smartctl_infos:
+        continue
+
+      diskutil_info = diskutil_infos.get(node)
+      smartctl_info = smartctl_infos[node]
+
+      # We can get most drive info from smartctl, but name, capacity, and usage
+      # are only reliably available via diskutil's APFS container stats.
+      if diskutil_info and smartctl_info:
+        smartctl_info = replace(
+            smartctl_info,
+            name=diskutil_info.name,
+            capacity=diskutil_info.capacity,
+            usage=diskutil_info.usage)
+
+      if info := smartctl_info or diskutil_info:
+        infos[node] = info
+
+    return infos
 
   async def get_raid_info(self, node: str) -> RAIDInfo:
     """Returns details and state for the given RAID.
@@ -71,3 +99,14 @@ class MacOSSource(Source):
       node: The RAID's Device Node, e.g. 'disk3'.
     """
     return await self._diskutil.get_raid_info(node)
+
+  async def get_raid_infos(self, nodes: Iterable[str]) -> dict[str, RAIDInfo]:
+    """Returns details and state for each of the given RAIDs.
+
+    RAIDs that can no longer be found are omitted from the result.
+
+    Args:
+      nodes: The RAIDs' Device Nodes, e.g. ['disk3', 'disk4'].
+    """
+    raid_infos = await self._diskutil.get_all_raid_info()
+    return {node: raid_infos[node] for node in nodes if node in raid_infos}
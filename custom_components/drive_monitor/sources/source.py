@@ -16,21 +16,24 @@ and are named macos.py, linux.py, windows.py, etc. They use tools and libraries
 to implement the Source interface.
 
 The DeviceManager and Device classes use the Source.get() method to obtain the
-Source implementation for the current OS, and use it to query devices.
+Source implementation for the current OS, and use it to query devices. Devices
+are polled together, from a Snapshot of all devices, so that each poll queries
+the system only once.
 """
 
 from __future__ import annotations
 
 import asyncio
 import importlib
-import inspect
 import platform
 import sys
 
 from abc import abstractmethod, ABC
+from dataclasses import dataclass, field
 from functools import cache
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Awaitable, Callable, Iterable, TypeVar
 
+from ..devices.device import DeviceNotFoundError
 from ..utils import async_cache
 
 if TYPE_CHECKING:
@@ -46,6 +49,21 @@ class SourceNotFoundError(Error):
   """There is no Source implementation for the current platform."""
 
 
+T = TypeVar('T')
+
+
+@dataclass
+class Snapshot:
+  """Details and state of every device on the system, queried together.
+
+  Attrs:
+    drives: Info for each physical drive, keyed by its Device Node.
+    raids: Info for each RAID, keyed by its Device Node.
+  """
+  drives: dict[str, DriveInfo] = field(default_factory=dict)
+  raids: dict[str, RAIDInfo] = field(default_factory=dict)
+
+
 class Source(ABC):
   """Abstract base class for classes that provide information about devices."""
 
@@ -60,13 +78,16 @@ class Source(ABC):
   async def get_raids(self) -> list[RAIDID]:
     """Returns keys for all RAIDs present on the system."""
 
-  @abstractmethod
   async def get_drive_info(self, node: str) -> DriveInfo:
     """Returns details and S.M.A.R.T. attributes for the given drive.
 
+    This is used by the default get_drive_infos. Sources must implement either
+    this method, or get_drive_infos if their tools query many drives at once.
+
     Args:
       node: The drive's Device Node, e.g. 'disk3'.
     """
+    raise NotImplementedError
 
   @abstractmethod
   async def get_raid_info(self, node: str) -> RAIDInfo:
@@ -76,6 +97,58 @@ class Source(ABC):
       node: The RAID's Device Node, e.g. 'disk3'.
     """
 
+  async def get_drive_infos(self, nodes: Iterable[str]) -> dict[str, DriveInfo]:
+    """Returns details and S.M.A.R.T. attributes for each of the given drives.
+
+    Drives that can no longer be found are omitted from the result. The default
+    implementation queries each drive concurrently; Sources whose tools support
+    querying many drives at once should override this.
+
+    Args:
+      nodes: The drives' Device Nodes, e.g. ['disk3', 'disk4'].
+    """
+    return await _gather_infos(nodes, self.get_drive_info)
+
+  async def get_raid_infos(self, nodes: Iterable[str]) -> dict[str, RAIDInfo]:
+    """Returns details and state for each of the given RAIDs.
+
+    RAIDs that can no longer be found are omitted from the result.
+
+    Args:
+      nodes: The RAIDs' Device Nodes, e.g. ['disk3', 'disk4'].
+    """
+    return await _gather_infos(nodes, self.get_raid_info)
+
+  async def snapshot(self) -> Snapshot:
+    """Returns details and state for every drive and RAID on the system."""
+    async with asyncio.TaskGroup() as group:
+      drives = group.create_task(self.get_drives())
+      raids = group.create_task(self.get_raids())
+
+    async with asyncio.TaskGroup() as group:
+      drive_infos = group.create_task(
+          self.get_drive_infos(drive.node for drive in drives.result()))
+      raid_infos = group.create_task(
+          self.get_raid_infos(raid.node for raid in raids.result()))
+
+    return Snapshot(drives=drive_infos.result(), raids=raid_infos.result())
+
+
+async def _gather_infos(
+    nodes: Iterable[str], get_info: Callable[[str], Awaitable[T]]) -> dict[str, T]:
+  """Calls get_info concurrently for each node, omitting devices not found."""
+  nodes = list(nodes)
+  infos = await asyncio.gather(*[get_info(node) for node in nodes], return_exceptions=True)
+
+  result = {}
+  for node, info in zip(nodes, infos):
+    if isinstance(info, DeviceNotFoundError):
+      continue
+    if isinstance(info, BaseException):
+      raise info
+    result[node] = info
+  return result
+
 
 @async_cache()
 async def get() -> Source:
@@ -84,11 +157,14 @@ async def get() -> Source:
   if name == 'Darwin':
     name = 'MacOS'
 
-  loop = asyncio.get_running_loop()
-  module = await loop.run_in_executor(
-      None, importlib.import_module, f'.{name.lower()}', __package__)
-  for _, value in inspect.getmembers(module):
-    if inspect.isclass(value) and issubclass(value, Source):
-      return value()
+  # Only hop to an executor if the module actually needs to be imported. HA
+  # reports imports that run inside the event loop as blocking calls.
+  module_name = f'{__package__}.{name.lower()}'
+  if not (module := sys.modules.get(module_name)):
+    loop = asyncio.get_running_loop()
+    module = await loop.run_in_executor(None, importlib.import_module, module_name)
+  for cls in Source.__subclasses__():
+    if cls.__module__ == module.__name__:
+      return cls()
 
   raise SourceNotFoundError(f'No Source defined for {name}')
@@ -3,17 +3,32 @@
 import asyncio
 import logging
 import plistlib
-import re
 
+from types import MappingProxyType
+from typing import Final, Mapping
+
+from ..devices.device import DeviceNotFoundError
 from ..devices.drive import DriveID, DriveInfo
 from ..devices.raid import RAIDDriveInfo, RAIDID, RAIDInfo, RAIDState, RAIDType
 from ..types import PList
-from ..utils import async_cache
-
-BASE_NODE_REGEX = re.compile(r'disk\d+')
+from ..utils import async_cache, execute
 
 LOGGER = logging.getLogger(__name__)
 
+# Mapping from diskutil RAID and RAID Member statuses to RAIDStates.
+_STATE_MAP: Final[Mapping[str, RAIDState]] = MappingProxyType({
+  'Online': RAIDState.ONLINE,
+  'Offline': RAIDState.OFFLINE,
+  'Rebuild': RAIDState.REBUILD,
+})
+
+# Mapping from diskutil RAID levels to RAIDTypes.
+_TYPE_MAP: Final[Mapping[str, RAIDType]] = MappingProxyType({
+  'Span': RAIDType.SPAN,
+  'Stripe': RAIDType.STRIPE,
+  'Mirror': RAIDType.MIRROR,
+})
+
 
 def base_node(node: str) -> str:
   """Returns the base of a disk node, with any suffixes stripped.
@@ -22,9 +37,15 @@ def base_node(node: str) -> str:
 
   If an invalid node value is passed, it is returned unchanged.
   """
-  if match := BASE_NODE_REGEX.match(node):
-    return match[0]
-  return node
+  if not node.startswith('disk'):
+    return node
+
+  # Equivalent to matching r'disk\d+', but this is called for every drive and
+  # container on each poll, and a simple scan avoids the regex machinery.
+  end = 4
+  while end < len(node) and node[end].isdecimal():
+    end += 1
+  return node[:end] if end > 4 else node
 
 
 def get_first_visible_volume(container: PList) -> PList | None:
@@ -40,12 +61,11 @@ def get_first_visible_volume(container: PList) -> PList | None:
   return None
 
 
-def get_container_usage(containers: PList, node: str) -> int | None:
-  """Returns the total usage of the given container node."""
-  for container in containers:
-    if container['DesignatedPhysicalStore'] == node:
-      return container['CapacityCeiling'] - container['CapacityFree']
-  return None
+def get_container_usages(containers: PList) -> dict[str, int]:
+  """Returns the total usage of each container, keyed by its node."""
+  return {container['DesignatedPhysicalStore']:
+              container['CapacityCeiling'] - container['CapacityFree']
+          for container in containers}
 
 def parse_drive_info(drive: PList) -> RAIDDriveInfo:
   """Parses a diskutil RAID Member plist into a RAIDDriveInfo."""
@@ -60,25 +80,25 @@ def parse_drive_info(drive: PList) -> RAIDDriveInfo:
 
 def parse_state(state: str) -> RAIDState:
   """Parses a diskutil RAID or RAID Member status into a RAIDState."""
-  return {
-    'Online': RAIDState.ONLINE,
-    'Offline': RAIDState.OFFLINE,
-    'Rebuild': RAIDState.REBUILD,
-  }.get(state, RAIDState.UNKNOWN)
+  return _STATE_MAP.get(state, RAIDState.UNKNOWN)
 
 
 def parse_type(type: str) -> RAIDType:
   """Parses a diskutil RAID level into a RAIDType."""
-  return {
-    'Span': RAIDType.SPAN,
-    'Stripe': RAIDType.STRIPE,
-    'Mirror': RAIDType.MIRROR,
-  }.get(type, RAIDType.UNKNOWN)
+  return _TYPE_MAP.get(type, RAIDType.UNKNOWN)
 
 
 class DiskUtil:
   """Wrapper around the MacOS Disk Utility 'diskutil' command."""
 
+  def __init__(self):
+    # Most recent 'apfs list' output, and the index built from it.
+    self._apfs_cache: tuple[PList | None, dict[str, DriveInfo]] = (None, {})
+
+    # Most recent 'appleraid list' and 'apfs list' output, and the index built
+    # from them.
+    self._raid_cache: tuple[PList | None, PList | None, dict[str, RAIDInfo]] = (None, None, {})
+
   async def get_drives(self) -> list[DriveID]:
     """Enumerates and returns all physical drives present on the system.
 
@@ -88,7 +108,8 @@ class DiskUtil:
 
     # Unfortunately 'apfs list' doesn't include RAID members. Query those
     # separately, and generate a mapping that we can then use to merge them.
-    raids = {raid.id: await self.get_raid_info(raid.node) for raid in raid_ids}
+    raid_infos = await asyncio.gather(*[self.get_raid_info(raid.node) for raid in raid_ids])
+    raids = dict(zip((raid.id for raid in raid_ids), raid_infos))
 
     drives = []
     for container in info['Containers']:
@@ -113,22 +134,13 @@ class DiskUtil:
     return [RAIDID(id=raid['AppleRAIDSetUUID'], node=raid['BSD Name'])
             for raid in info.get('AppleRAIDSets', [])]
 
-  async def get_drive_info(self, node: str) -> DriveInfo | None:
-    """Returns capacity and usage for the given drive.
+  async def get_all_drive_info(self) -> dict[str, DriveInfo]:
+    """Returns capacity and usage for every drive, keyed by its Device Node.
 
-    Args:
-      node: The drive's Device Node, e.g. 'disk3'.
+    Only drives that are the designated store of an APFS container are present.
+    The result is shared with other callers, and must not be modified.
     """
-    info = await self._execute('apfs', 'list')
-
-    for container in info['Containers']:
-      if node == container['DesignatedPhysicalStore']:
-        return DriveInfo(
-            name=get_first_visible_volume(container)['Name'],
-            capacity=container['CapacityCeiling'],
-            usage=container['CapacityCeiling'] - container['CapacityFree'])
-
-    return None
+    return await self._apfs_index()
 
   async def get_raid_info(self, node: str) -> RAIDInfo:
     """Returns details and state for the given RAID.
@@ -136,31 +148,78 @@ class DiskUtil:
     Args:
       node: The RAID's Device Node, e.g. 'disk3'.
     """
+    if info := (await self._raid_index()).get(node):
+      return info
+
+    raise DeviceNotFoundError(f'There is no RAID with node "{node}".')
+
+  async def get_all_raid_info(self) -> dict[str, RAIDInfo]:
+    """Returns details and state for every RAID, keyed by its Device Node.
+
+    The result is shared with other callers, and must not be modified.
+    """
+    return await self._raid_index()
+
+  async def _apfs_index(self) -> dict[str, DriveInfo]:
+    """Returns capacity and usage for each APFS container's designated drive.
+
+    The result is keyed by the drive's Device Node. It's built once from each
+    'apfs list' result, so looking up many drives doesn't rescan all containers
+    for each one.
+    """
+    info = await self._execute('apfs', 'list')
+
+    plist, index = self._apfs_cache
+    if plist is not info:
+      index = {}
+      for container in info['Containers']:
+        # Ignore containers that don't have any user-visible volumes
+        if volume := get_first_visible_volume(container):
+          index[container['DesignatedPhysicalStore']] = DriveInfo(
+              name=volume['Name'],
+              capacity=container['CapacityCeiling'],
+              usage=container['CapacityCeiling'] - container['CapacityFree'])
+      self._apfs_cache = (info, index)
+
+    return index
+
+  async def _raid_index(self) -> dict[str, RAIDInfo]:
+    """Returns details and state for each RAID, keyed by its Device Node.
+
+    Like _apfs_index, this is built once from each pair of 'appleraid list' and
+    'apfs list' results, rather than rescanning them for every RAID.
+    """
     raid_info, apfs_info = await asyncio.gather(
         self._execute('appleraid', 'list'), self._execute('apfs', 'list'))
 
-    for raid in raid_info.get('AppleRAIDSets', []):
-      if raid['BSD Name'] == node:
-        return RAIDInfo(
+    raid_plist, apfs_plist, index = self._raid_cache
+    if raid_plist is not raid_info or apfs_plist is not apfs_info:
+      usages = get_container_usages(apfs_info['Containers'])
+      index = {
+        raid['BSD Name']: RAIDInfo(
             name=raid['Name'],
             type=parse_type(raid['Level']),
             state=parse_state(raid['Status']),
-            members=[parse_drive_info(drive) for drive in raid['Members']],
+            members=tuple(parse_drive_info(drive) for drive in raid['Members']),
             capacity=raid['Size'],
-            usage=get_container_usage(apfs_info['Containers'], node))
+            usage=usages.get(raid['BSD Name']))
+        for raid in raid_info.get('AppleRAIDSets', [])
+      }
+      self._raid_cache = (raid_info, apfs_info, index)
 
-    raise DeviceNotFoundError(f'There is no RAID with node "{node}".')
+    return index
 
   @async_cache(ttl=10)  # Cache the result and re-execute only every 10 seconds
   async def _execute(self, *args: list[str]) -> PList:
     """Executes 'diskutil' with the given arguments, returning parsed output."""
     LOGGER.debug(f'Executing "diskutil %s -plist"', ' '.join(args))
-    process = await asyncio.create_subprocess_exec(
-        'diskutil', *args, '-plist', close_fds=True, stdout=asyncio.subprocess.PIPE)
-    stdout, stderr = await process.communicate()
+    stdout = await execute('diskutil', *args, '-plist')
 
     try:
-      return plistlib.loads(stdout)
+      # XML plists for systems with many volumes or snapshots can be hundreds of
+      # KB, so parse them without blocking the event loop.
+      loop = asyncio.get_running_loop()
+      return await loop.run_in_executor(None, plistlib.loads, stdout)
     except plistlib.InvalidFileException:
       LOGGER.error('Invalid output from "diskutil": %s', stdout)
       raise
@@ -5,14 +5,29 @@ import json
 import logging
 
 from enum import IntEnum
+from operator import itemgetter
+from typing import Final, Iterable
+
+try:
+  from orjson import loads as json_loads  # Bundled with HA, and much faster
+except ImportError:
+  from json import loads as json_loads
 
 from ..devices.drive import DriveInfo, SSDInfo
 from ..manufacturers import get as get_manufacturer
 from ..types import JSON
-from ..utils import async_cache
+from ..utils import async_cache, execute
 
 LOGGER = logging.getLogger(__name__)
 
+# Maximum number of drives to query at once. Each query wakes the drive and reads
+# its S.M.A.R.T. data, so querying every drive at the same time creates a burst
+# of I/O, and can spin up all of a system's HDDs at once.
+MAX_CONCURRENT_QUERIES = 2
+
+# Number of seconds to cache drive info before querying the drive again.
+CACHE_TTL = 10
+
 
 class ReturnValue(IntEnum):
   """Non-successful exit statuses produced by smartctl."""
@@ -26,16 +41,19 @@ class ReturnValue(IntEnum):
   DEVICE_SELF_TEST_ERROR = 128
 
 
-def parse_data_units(info: JSON, key: str) -> int | None:
-  """Parses the given 'data units' value into a value in bytes."""
-  if key in info:
-    return info[key] * 512000  # Number of bytes in a data unit
-  return None
+# Exit status bits indicating that smartctl couldn't read the drive at all.
+_UNREADABLE: Final[int] = ReturnValue.COMMAND_LINE_DID_NOT_PARSE | ReturnValue.DEVICE_OPEN_FAILED
 
+# Extracts the fields that smartctl always reports for a readable drive, in one call.
+_get_required_fields: Final = itemgetter(
+    'device', 'model_name', 'serial_number', 'firmware_version')
 
-def parse_exit_status(status: int) -> set[ReturnValue]:
-  """Parses the smartctl exit status bit into an enum of statuses."""
-  return {value for value in ReturnValue if status & value}
+
+def parse_data_units(data_units: int | None) -> int | None:
+  """Parses the given 'data units' value, if any, into a value in bytes."""
+  if data_units is None:
+    return None
+  return data_units * 512000  # Number of bytes in a data unit
 
 
 def parse_smart_state(info: JSON) -> bool:
@@ -45,6 +63,13 @@ def parse_smart_state(info: JSON) -> bool:
   return False
 
 
+def parse_temperature(info: JSON) -> int | None:
+  """Parses the drive's current temperature, if it reports one."""
+  if temperature := info.get('temperature'):
+    return temperature.get('current')
+  return None
+
+
 def parse_ssd_info(info: JSON) -> SSDInfo | None:
   """Parses additional SSD-specific fields, if any, into an SSDInfo."""
   if 'nvme_smart_health_information_log' not in info:
@@ -52,8 +77,8 @@ def parse_ssd_info(info: JSON) -> SSDInfo | None:
 
   nvme_info = info['nvme_smart_health_information_log']
   return SSDInfo(
-      bytes_read=parse_data_units(nvme_info, 'data_units_read'),
-      bytes_written=parse_data_units(nvme_info, 'data_units_written'),
+      bytes_read=parse_data_units(nvme_info.get('data_units_read')),
+      bytes_written=parse_data_units(nvme_info.get('data_units_written')),
       available_spare=nvme_info.get('available_spare'),
       available_spare_threshold=nvme_info.get('available_spare_threshold'),
       unsafe_shutdowns=nvme_info.get('unsafe_shutdowns'))
@@ -62,42 +87,81 @@ def parse_ssd_info(info: JSON) -> SSDInfo | None:
 class SmartCtl:
   """Wrapper around the Smartmontools 'smartctl' command."""
 
+  def __init__(self):
+    self._queries = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+
+  # Drives that smartctl can't open are cached for the same time as any other
+  # result, since e.g. a drive that's busy or was just re-inserted may become
+  # readable again on the next poll.
+  @async_cache(ttl=CACHE_TTL)
   async def get_drive_info(self, node: str) -> DriveInfo | None:
     """Returns details and S.M.A.R.T. attributes for the given drive.
 
     Args:
       node: The drive's Device Node, e.g. 'disk3'.
     """
-    info = await self._execute('-a', node)
-
-    exit_status = parse_exit_status(info['smartctl']['exit_status'])
-    if exit_status & {ReturnValue.COMMAND_LINE_DID_NOT_PARSE, ReturnValue.DEVICE_OPEN_FAILED}:
+    # Request only the sections that are actually read below: device info (-i),
+    # health (-H), and attributes (-A), which include temperature and the NVMe
+    # health log. Unlike -a, this skips the capabilities, error and self-test
+    # logs, which make up much of the output, and take extra commands to read.
+    async with self._queries:
+      info = await self._execute('-i', '-H', '-A', node)
+
+    if info['smartctl']['exit_status'] & _UNREADABLE:
       return None
 
-    manufacturer = await get_manufacturer(info.get('model_family', info['model_name']))
-    temperature = info.get('temperature')
+    device, model, serial_number, firmware_version = _get_required_fields(info)
+    manufacturer = get_manufacturer(info.get('model_family', model))
 
     return DriveInfo(
-        name=info['device']['name'],
-        type=info['device']['type'],
+        name=device['name'],
+        type=device['type'],
         manufacturer=manufacturer,
-        model=info['model_name'],
-        serial_number=info['serial_number'],
-        firmware_version=info['firmware_version'],
+        model=model,
+        serial_number=serial_number,
+        firmware_version=firmware_version,
         smart_passed=parse_smart_state(info),
-        temperature=temperature['current'] if temperature else None,
+        temperature=parse_temperature(info),
         ssd_info=parse_ssd_info(info))
 
-  @async_cache(ttl=10)  # Cache the result and re-execute only every 10 seconds
+  async def get_all_drive_info(self, nodes: Iterable[str]) -> dict[str, DriveInfo | None]:
+    """Returns details and S.M.A.R.T. attributes for each of the given drives.
+
+    smartctl can only query one device per run, so this still runs it once per
+    drive, but at most MAX_CONCURRENT_QUERIES at a time. Drives that smartctl
+    can't open map to None. Drives whose query fails, e.g. due to unexpected
+    output, are logged and omitted, so that one drive can't fail the others.
+    Only if every drive fails is the first drive's exception raised.
+
+    Args:
+      nodes: The drives' Device Nodes, e.g. ['disk3', 'disk4'].
+    """
+    nodes = list(nodes)
+    infos = await asyncio.gather(
+        *[self.get_drive_info(node) for node in nodes], return_exceptions=True)
+
+    result = {}
+    errors = []
+    for node, info in zip(nodes, infos):
+      if isinstance(info, Exception):
+        LOGGER.warning('Failed to query drive %s with smartctl: %r', node, info)
+        errors.append(info)
+      elif isinstance(info, BaseException):
+        raise info
+      else:
+        result[node] = info
+
+    if errors and not result:
+      raise errors[0]
+    return result
+
   async def _execute(self, *args: list[str]) -> JSON:
     """Executes 'smartctl' with the given arguments, returning parsed output."""
     LOGGER.debug('Executing "smartctl %s --json"', ' '.join(args))
-    process = await asyncio.create_subprocess_exec(
-        'smartctl', *args, '--json', close_fds=True, stdout=asyncio.subprocess.PIPE)
-    stdout, stderr = await process.communicate()
+    stdout = await execute('smartctl', *args, '--json')
 
     try:
-      return json.loads(stdout)
-    except json.JSONDecodeError:
+      return json_loads(stdout)
+    except json.JSONDecodeError:  # orjson.JSONDecodeError is a subclass
       LOGGER.error('Invalid output from "smartctl": %s', stdout)
       raise
@@ -3,7 +3,7 @@
 from typing import Any
 
 
-# JSON parsed by the stdlib 'json' library
+# JSON parsed by 'orjson' or the stdlib 'json' library
 JSON = dict[str, Any]
 
 # PLists parsed by the stdlib 'plistlib' library
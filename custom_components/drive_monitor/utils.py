@@ -3,12 +3,37 @@
 from __future__ import annotations
 
 import asyncio
+import math
+import shutil
 import time
 
 from functools import wraps
 
 
-def async_cache(ttl: int | None = None):
+async def execute(*args: str) -> bytes:
+  """Runs a command-line tool to completion, and returns its standard output.
+
+  The output is read in full with a single await, rather than line by line; the
+  tools used by this component produce a single small document.
+
+  Args:
+    args: The tool's executable name, followed by its arguments.
+  """
+  # CPython only launches a subprocess with posix_spawn, which is much cheaper
+  # than fork + exec in a process as large as HA, if its executable is given as a
+  # path and close_fds is False. The latter is safe, since Python creates file
+  # descriptors as non-inheritable by default.
+  executable = await _find_executable(args[0])
+  process = await asyncio.create_subprocess_exec(
+      executable, *args[1:], close_fds=False, stdout=asyncio.subprocess.PIPE)
+  # Only stdout is piped, so there's no need for communicate(), which schedules
+  # extra tasks to feed stdin and drain stderr.
+  stdout = await process.stdout.read()
+  await process.wait()
+  return stdout
+
+
+def async_cache(ttl: float | None = None):
   """Decorator similar to functools.cache, but supporting async functions.
 
   An async coroutine object can only be awaited once, making it impossible to
@@ -23,6 +48,12 @@ def async_cache(ttl: int | None = None):
   then the next time the decorated function is called, it will replace the Task
   with a new one, calling and scheduling the original function again.
 
+  The age of a Task is measured from when it completes. Until then, all callers
+  await the same in-flight Task, regardless of TTL. So a slow call, e.g. to a
+  command-line tool waiting on a drive to spin up, is never duplicated by other
+  callers that arrive while it is still running. A Task that is cancelled, e.g.
+  on shutdown, is never cached, since it has no result.
+
   Arguments are equal by value, ignoring type. So an @async_cache function that
   is called twice, with args of different types but having the same value, will
   treat the second call as cached.
@@ -32,15 +63,68 @@ def async_cache(ttl: int | None = None):
         Note: Stale entries are not removed from the cache; they are simply
         replaced the next time the function is called and awaited.
   """
-  calls = {}
+  calls: dict[tuple, _Entry] = {}
   def decorator(f):
     @wraps(f)
     async def wrapper(*args, **kwargs):
-      key = hash((args, frozenset(kwargs.items())))
-      task, timestamp = calls.get(key, (None, None))
-      if not task or ttl and time.time_ns() - timestamp > ttl * 1e9:
-        task = asyncio.ensure_future(f(*args, **kwargs))
-        calls[key] = (task, time.time_ns() if ttl else None)
-      return await task
+      # Key on the arguments themselves, not their hash, so that calls whose args
+      # merely collide in hash don't share a result.
+      key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+      entry = calls.get(key)
+      if entry is None or time.monotonic() > entry.expiration:
+        entry = calls[key] = _Entry(asyncio.ensure_future(f(*args, **kwargs)))
+        entry.task.add_done_callback(
+            lambda _, key=key, entry=entry: _set_expiration(calls, key, entry, ttl))
+      # Shield the shared Task, so that one caller being cancelled doesn't cancel
+      # it for every other caller awaiting it.
+      return await asyncio.shield(entry.task)
     return wrapper
   return decorator
+
+
+class _Entry:
+  """A Task cached by @async_cache, and the monotonic time when it expires.
+
+  The expiration is infinite while the Task is in flight, so that it's never
+  replaced, and for results that never expire.
+  """
+  __slots__ = ('task', 'expiration')
+
+  def __init__(self, task: asyncio.Task):
+    self.task: asyncio.Task = task
+    self.expiration: float = math.inf
+
+
+def _set_expiration(calls: dict[tuple, _Entry], key: tuple, entry: _Entry, ttl: float | None):
+  """Records the expiration time of a Task cached by @async_cache."""
+  if calls.get(key) is not entry:
+    return
+
+  if entry.task.cancelled():
+    del calls[key]
+    return
+
+  if ttl is not None:
+    entry.expiration = time.monotonic() + ttl
+
+
+# Full paths of executables found by _find_executable, keyed by name.
+_executable_paths: dict[str, str] = {}
+
+
+async def _find_executable(name: str) -> str:
+  """Returns the full path of the given executable, or the name if not found.
+
+  Looking up the path scans each directory in PATH, so it's done in an executor
+  to avoid blocking the event loop, and remembered once found. An executable
+  that isn't found is looked up again on the next call, since e.g. PATH may not
+  be fully set up yet when HA starts.
+  """
+  if path := _executable_paths.get(name):
+    return path
+
+  loop = asyncio.get_running_loop()
+  if path := await loop.run_in_executor(None, shutil.which, name):
+    _executable_paths[name] = path
+    return path
+  return name